@@ -11,38 +11,39 @@ logger = logging.getLogger(__name__)
 
 
 def to_str(packet):
-    return ''.join([format(x, '02x') for x in packet])
+    return bytes(packet).hex()
 
 
 def get_length(defs, v):
-    for (value, length) in defs:
-        if value == v:
-            return length
-
-    raise ValueError('BadType')
+    try:
+        return defs[v]
+    except KeyError:
+        raise ValueError('BadType') from None
 
 
 def tvs_to_bytes(defs, tvs):
-    payload = (len(tvs)).to_bytes(1, 'little')
+    payload = bytearray((len(tvs)).to_bytes(1, 'little'))
 
     for (t, v) in tvs:
         length = get_length(defs, t)
 
-        payload += (t).to_bytes(1, 'little')
+        payload.extend((t).to_bytes(1, 'little'))
 
         if type(v) == list:
-            payload += (len(v) * length).to_bytes(1, 'little')
+            payload.extend((len(v) * length).to_bytes(1, 'little'))
             for s in v:
-                payload += (s).to_bytes(length, 'little')
+                payload.extend((s).to_bytes(length, 'little'))
         else:
-            payload += (length).to_bytes(1, 'little')
-            payload += (v).to_bytes(length, 'little')
+            payload.extend((length).to_bytes(1, 'little'))
+            payload.extend((v).to_bytes(length, 'little'))
 
-    return payload
+    return bytes(payload)
 
 
 def tlvs_from_bytes(enum_class, payload):
     res = []
+    # read values through a view: slicing it does not copy the payload
+    payload = memoryview(payload)
     n = payload[0]
     p = 1
 
@@ -58,12 +59,8 @@ def tlvs_from_bytes(enum_class, payload):
         if l_elem == l:
             v = (int).from_bytes(payload[p:p + l], 'little')
         elif (l % l_elem) == 0:
-            nb_elem = int(l / l_elem)
-            v = []
-
-            for i in range(nb_elem):
-                v.append((int).from_bytes(
-                    payload[p + i * l_elem:p + (i + 1) * l_elem], 'little'))
+            v = [(int).from_bytes(payload[q:q + l_elem], 'little')
+                 for q in range(p, p + l, l_elem)]
         else:
             raise ValueError('BadLength')
 
@@ -78,12 +75,12 @@ def tlvs_from_bytes(enum_class, payload):
 
 
 def list_to_bytes(elems):
-    payload = (len(elems)).to_bytes(1, 'little')
+    payload = bytearray((len(elems)).to_bytes(1, 'little'))
 
     for e in elems:
-        payload += (e).to_bytes(1, 'little')
+        payload.extend((e).to_bytes(1, 'little'))
 
-    return payload
+    return bytes(payload)
 
 
 def list_from_bytes(status_class, payload):
@@ -145,13 +142,12 @@ class Client():
     def packet_received(self, packet):
         logger.debug(f'recv: {to_str(packet)}')
 
-        header = packet[0:4]
         payload = bytearray(packet[4:])
 
-        mt = (header[0] & 0xe0) >> 5
-        bpf = (header[0] & 0x10) >> 4
-        gid = (header[0] & 0x0f)
-        oid = header[1]
+        mt = (packet[0] & 0xe0) >> 5
+        bpf = (packet[0] & 0x10) >> 4
+        gid = (packet[0] & 0x0f)
+        oid = packet[1]
 
         # check msg
         if self.msg:
@@ -14,7 +14,8 @@ logger = logging.getLogger(__name__)
 
 
 class Factory(ABCMeta):
-    __transports__ = []
+    # registered transports, in registration order
+    __transports__ = {}
 
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -29,12 +30,12 @@ class Factory(ABCMeta):
     def register(cls):
         if cls in Factory.__transports__:
             raise ValueError(f'{cls} already registered')
-        Factory.__transports__.append(cls)
+        Factory.__transports__[cls] = None
 
     def unregister(cls):
         if cls not in Factory.__transports__:
             raise ValueError(f'{cls} not registered')
-        Factory.__transports__.remove(cls)
+        del Factory.__transports__[cls]
 
     @staticmethod
     def get(callback, *args, **kwargs):
@@ -103,7 +104,7 @@ class UartTransportProtocol(serial.threaded.Protocol):
             # got a packet
             self.cb(self.buffer[0:4+size])
 
-            self.buffer = self.buffer[4+size:]
+            del self.buffer[:4+size]
 
     def data_received(self, data):
         self.buffer.extend(data)
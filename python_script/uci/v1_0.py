@@ -1,6 +1,8 @@
 # Copyright (c) 2021 Qorvo US, Inc.
 import enum
+import functools
 import struct
+import types
 import typing
 
 from colorama import Fore, Style, init
@@ -9,51 +11,36 @@ import uci.core as core
 
 init()
 
+_U32U32 = struct.Struct('<II')
+_U32U8U8 = struct.Struct('<IBB')
+# status, UCI generic/MAC/PHY/test versions, vendor info length
+_CORE_DEVICE_INFO = struct.Struct('<BHHHHB')
+# short address, status, (NLoS), distance, AoA azimuth, AoA azimuth FOM
+_RANGING_SUMMARY = struct.Struct('<HBxHHB')
+
+
+@functools.lru_cache(maxsize=None)
+def _q_format(number_integer_bits: int, number_frac_bits: int) -> tuple:
+    """
+    Returns the word mask, sign bit, word range and LSB weight of a Q-format
+    """
+    NUMBER_BITS = number_integer_bits + number_frac_bits
+    return ((1 << NUMBER_BITS) - 1, 1 << (NUMBER_BITS - 1), 1 << NUMBER_BITS,
+            2.0**-number_frac_bits)
+
 
 def _decode_q_format(number_integer_bits: int, number_frac_bits: int,
                      value: bytes, signed: bool = True) -> float:
-    if signed:
-        SIGN_POSITION = number_integer_bits + number_frac_bits - 1
-        INTEGER_MASK = 2 ** (number_integer_bits - 1) - 1
-        INTEGER_POSITION = number_frac_bits
-        SIGN_VALUE = 2**(number_integer_bits - 1)
-        FRACTIONAL_MASK = 2 ** (number_frac_bits) - 1
-        FRACTIONAL_POSITION = 0
-
-        encoded_value = int.from_bytes(value, 'little')
-        # check sign
-        sign = bool((encoded_value & (1 << SIGN_POSITION)))
-        # get integer part using a mask
-        integer_part = (encoded_value &
-                        (INTEGER_MASK << INTEGER_POSITION)) >> INTEGER_POSITION
-        # substract the value of the sign bit
-        signed_value = integer_part if not sign else integer_part - SIGN_VALUE
-        # extract fractional part
-        fractional_part = (encoded_value &
-                           (FRACTIONAL_MASK << FRACTIONAL_POSITION)
-                           ) >> FRACTIONAL_POSITION
-        # normalize fractional part
-        fractional_value = fractional_part / 2.0**INTEGER_POSITION
-        # return whole value
-        return signed_value + fractional_value
-    else:
-        INTEGER_MASK = 2 ** (number_integer_bits) - 1
-        INTEGER_POSITION = number_frac_bits
-        FRACTIONAL_MASK = 2 ** (number_frac_bits) - 1
-        FRACTIONAL_POSITION = 0
-
-        encoded_value = int.from_bytes(value, 'little')
-        # get integer part using a mask
-        integer_part = (encoded_value &
-                        (INTEGER_MASK << INTEGER_POSITION)) >> INTEGER_POSITION
-        # extract fractional part
-        fractional_part = (encoded_value &
-                           (FRACTIONAL_MASK << FRACTIONAL_POSITION)
-                           ) >> FRACTIONAL_POSITION
-        # normalize fractional part
-        fractional_value = fractional_part / 2.0**INTEGER_POSITION
-        # return whole value
-        return integer_part + fractional_value
+    (mask, sign_bit, word_range, scale) = _q_format(number_integer_bits,
+                                                    number_frac_bits)
+
+    # keep only the bits of the Q-format word
+    encoded_value = int.from_bytes(value, 'little') & mask
+    # two's complement: a set sign bit weighs -2^(NUMBER_BITS - 1)
+    if signed and encoded_value & sign_bit:
+        encoded_value -= word_range
+    # scale by the weight of the least significant fractional bit
+    return encoded_value * scale
 
 
 def byte_slice() -> typing.Generator:
@@ -168,11 +155,11 @@ class Device(enum.IntEnum):
     ChannelNumber = 0xA0
 
 
-Device.defs = [
-    (Device.State, 1),
-    (Device.LowPowerMode, 1),
-    (Device.ChannelNumber, 1),
-]
+Device.defs = {
+    Device.State: 1,
+    Device.LowPowerMode: 1,
+    Device.ChannelNumber: 1,
+}
 
 
 class DeviceState(enum.IntEnum):
@@ -235,59 +222,59 @@ class App(enum.IntEnum):
     DiagsFrameReportsFields = 0xe9
 
 
-App.defs = [
-    (App.DeviceType, 1),
-    (App.RangingRoundUsage, 1),
-    (App.StsConfig, 1),
-    (App.MultiNodeMode, 1),
-    (App.ChannelNumber, 1),
-    (App.NumberOfControlees, 1),
-    (App.DeviceMacAddress, 2),  # or 8?
-    (App.DstMacAddress, 2),  # or 8
-    (App.SlotDuration, 2),
-    (App.RangingInterval, 4),
-    (App.StsIndex, 4),
-    (App.MacFcsType, 1),
-    (App.RangingRoundControl, 1),
-    (App.AoaResultReq, 1),
-    (App.RangeDataNtfConfig, 1),
-    (App.RangeDataNtfProximityNear, 2),
-    (App.RangeDataNtfProximityFar, 2),
-    (App.DeviceRole, 1),
-    (App.RframeConfig, 1),
-    (App.PreambleCodeIndex, 1),
-    (App.SfdId, 1),
-    (App.PsduDataRate, 1),
-    (App.PreambleDuration, 1),
-    (App.RangingTimeStruct, 1),
-    (App.SlotsPerRr, 1),
-    (App.TxAdaptivePayloadPower, 1),
-    (App.ResponderSlotIndex, 1),
-    (App.PrfMode, 1),
-    (App.ScheduleMode, 1),
-    (App.KeyRotation, 1),
-    (App.KeyRotationRate, 1),
-    (App.SessionPriority, 1),
-    (App.MacAddressMode, 1),
-    (App.VendorId, 2),
-    (App.StaticStsIv, 6),
-    (App.NumberOfStsSegments, 1),
-    (App.MaxRrRetry, 2),
-    (App.UwbInitiationTime, 4),
-    (App.HoppingMode, 1),
-    (App.BlockStrideLength, 1),
-    (App.ResultReportConfig, 1),
-    (App.InBandTerminationAttemptCount, 1),
-    (App.SubSessionId, 4),
-    (App.BprfPhrDataRate, 1),
-    (App.MaxNumberOfMeasurements, 2),
-    (App.StsLength, 1),
-    (App.RssiReporting, 1),
-    (App.RxAntennaSelection, 1),
-    (App.TxAntennaSelection, 1),
-    (App.EnableDiagnostics, 1),
-    (App.DiagsFrameReportsFields, 1)
-]
+App.defs = {
+    App.DeviceType: 1,
+    App.RangingRoundUsage: 1,
+    App.StsConfig: 1,
+    App.MultiNodeMode: 1,
+    App.ChannelNumber: 1,
+    App.NumberOfControlees: 1,
+    App.DeviceMacAddress: 2,  # or 8?
+    App.DstMacAddress: 2,  # or 8
+    App.SlotDuration: 2,
+    App.RangingInterval: 4,
+    App.StsIndex: 4,
+    App.MacFcsType: 1,
+    App.RangingRoundControl: 1,
+    App.AoaResultReq: 1,
+    App.RangeDataNtfConfig: 1,
+    App.RangeDataNtfProximityNear: 2,
+    App.RangeDataNtfProximityFar: 2,
+    App.DeviceRole: 1,
+    App.RframeConfig: 1,
+    App.PreambleCodeIndex: 1,
+    App.SfdId: 1,
+    App.PsduDataRate: 1,
+    App.PreambleDuration: 1,
+    App.RangingTimeStruct: 1,
+    App.SlotsPerRr: 1,
+    App.TxAdaptivePayloadPower: 1,
+    App.ResponderSlotIndex: 1,
+    App.PrfMode: 1,
+    App.ScheduleMode: 1,
+    App.KeyRotation: 1,
+    App.KeyRotationRate: 1,
+    App.SessionPriority: 1,
+    App.MacAddressMode: 1,
+    App.VendorId: 2,
+    App.StaticStsIv: 6,
+    App.NumberOfStsSegments: 1,
+    App.MaxRrRetry: 2,
+    App.UwbInitiationTime: 4,
+    App.HoppingMode: 1,
+    App.BlockStrideLength: 1,
+    App.ResultReportConfig: 1,
+    App.InBandTerminationAttemptCount: 1,
+    App.SubSessionId: 4,
+    App.BprfPhrDataRate: 1,
+    App.MaxNumberOfMeasurements: 2,
+    App.StsLength: 1,
+    App.RssiReporting: 1,
+    App.RxAntennaSelection: 1,
+    App.TxAntennaSelection: 1,
+    App.EnableDiagnostics: 1,
+    App.DiagsFrameReportsFields: 1
+}
 
 
 class TestParam(enum.IntEnum):
@@ -302,17 +289,17 @@ class TestParam(enum.IntEnum):
     StsIndexAutoIncr = 0x08,
 
 
-TestParam.defs = [
-    (TestParam.NumPackets, 4),
-    (TestParam.TGap, 4),
-    (TestParam.TStart, 4),
-    (TestParam.TWin, 4),
-    (TestParam.RandomizePsdu, 1),
-    (TestParam.PhrRangingBit, 1),
-    (TestParam.RMarkerTxStart, 4),
-    (TestParam.RMarkerRxStart, 4),
-    (TestParam.StsIndexAutoIncr, 1),
-]
+TestParam.defs = {
+    TestParam.NumPackets: 4,
+    TestParam.TGap: 4,
+    TestParam.TStart: 4,
+    TestParam.TWin: 4,
+    TestParam.RandomizePsdu: 1,
+    TestParam.PhrRangingBit: 1,
+    TestParam.RMarkerTxStart: 4,
+    TestParam.RMarkerRxStart: 4,
+    TestParam.StsIndexAutoIncr: 1,
+}
 
 
 class State(enum.IntEnum):
@@ -434,6 +421,12 @@ class RANGE_DATA_NTF(NTF):
     GID = Gid.UwbRangingSessionControl
     OID = 0x0
     MIN_EXPECTED_PAYLOAD_SIZE = 50
+    # sequence number, session id, RCR indication, current ranging
+    # interval, measurement type, RFU, MAC addressing mode, RFU, count
+    _HEADER = struct.Struct('<IIBIBsB8sB')
+    # MAC address, status, NLoS, distance, AoA azimuth/elevation and
+    # destination azimuth/elevation (raw Q9.7 + FOM each), slot index, RSSI
+    _MEASUREMENT = struct.Struct('<HBBH2sB2sB2sB2sBBs')
 
     def __init__(self, payload: bytes):
 
@@ -443,43 +436,26 @@ class RANGE_DATA_NTF(NTF):
                              f'{self.MIN_EXPECTED_PAYLOAD_SIZE} B, got '
                              f'{payload_size} B')
 
-        handlePayload = PayloadHandler(payload)
-        self.SequenceNumber = handlePayload.get_next_field(4)
-        self.SessionID = handlePayload.get_next_field(4)
-        self.RCRIndication = handlePayload.get_next_field(1)
-        self.CurrentRangingInterval = handlePayload.get_next_field(4)
-        self.RangingMeasurementType = handlePayload.get_next_field(1)
-        self.RFU1 = handlePayload.get_bytes(1)
-        self.MACAddressingModeIndicator = handlePayload.get_next_field(1)
-        self.RFU2 = handlePayload.get_bytes(8)
-        self.NumberofRangingMeasurements = handlePayload.get_next_field(1)
-
-        self.RangingMeasurements = []
+        (self.SequenceNumber, self.SessionID, self.RCRIndication,
+         self.CurrentRangingInterval, self.RangingMeasurementType,
+         self.RFU1, self.MACAddressingModeIndicator, self.RFU2,
+         self.NumberofRangingMeasurements) = self._HEADER.unpack_from(payload)
+
+        self.RangingMeasurements = [None] * self.NumberofRangingMeasurements
         for i in range(self.NumberofRangingMeasurements):
             p = 25 + i * 31
-            self.MACAddress = int.from_bytes(payload[p:p + 2], 'little')
-            self.Status = Status(int.from_bytes(
-                payload[p + 2:p + 3], 'little'))
-            self.NLoS = int.from_bytes(payload[p + 3:p + 4], 'little')
-            self.Distance = int.from_bytes(payload[p + 4:p + 6], 'little')
-
-            self.bAoAAzimuth = payload[p + 6:p + 8]
+            (self.MACAddress, status, self.NLoS, self.Distance,
+             self.bAoAAzimuth, self.AoAAzimuthFOM,
+             self.bAoAElevation, self.AoAElevationFOM,
+             self.bAoADestinationAzimuth, self.AoADestinationAzimuthFOM,
+             self.bAoADestinationElevation, self.AoADestinationElevationFOM,
+             self.SlotIndex, self.bRSSI) = \
+                self._MEASUREMENT.unpack_from(payload, p)
+            self.Status = Status(status)
             self.AoAAzimuth = self.get_AoA_Azimuth()
-            self.AoAAzimuthFOM = int.from_bytes(payload[p + 8:p + 9], 'little')
-            self.bAoAElevation = payload[p + 9:p + 11]
             self.AoAElevation = self.get_AoA_Elevation()
-            self.AoAElevationFOM = int.from_bytes(
-                payload[p + 11:p + 12], 'little')
-            self.bAoADestinationAzimuth = payload[p + 12:p + 14]
             self.AoADestinationAzimuth = self.get_AoA_Destination_Azimuth()
-            self.AoADestinationAzimuthFOM = int.from_bytes(
-                payload[p + 14:p + 15], 'little')
-            self.bAoADestinationElevation = payload[p + 15:p + 17]
             self.AoADestinationElevation = self.get_AoA_Destination_Elevation()
-            self.AoADestinationElevationFOM = int.from_bytes(
-                payload[p + 17:p + 18], 'little')
-            self.SlotIndex = int.from_bytes(payload[p + 18:p + 19], 'little')
-            self.bRSSI = payload[p + 19:p + 20]
             self.RSSI = self.get_RSSI()
             self.RFU3 = int.from_bytes(payload[p + 20:], 'little')
 
@@ -501,7 +477,7 @@ class RANGE_DATA_NTF(NTF):
                                           'RSSI':
                                           self.RSSI
                                       }
-            self.RangingMeasurements.append(self.range_measurement)
+            self.RangingMeasurements[i] = self.range_measurement
 
     def get_AoA_Azimuth(self) -> float:
         return _decode_q_format(9, 7, self.bAoAAzimuth)
@@ -519,27 +495,27 @@ class RANGE_DATA_NTF(NTF):
         return _decode_q_format(7, 1, self.bRSSI, False)
 
     def __str__(self) -> str:
-        return f'<{type(self).__name__}: ' + \
-               f'SequenceNumber : {self.SequenceNumber} ' + \
-               f'SessionID : {self.SessionID} ' + \
-               f'MACAddress : {self.MACAddress} ' + \
-               f'Status : {self.Status.name} ' + \
-               f'Distance : {self.Distance} ' + \
-               f'AoAAzimuth : {self.AoAAzimuth} ' + \
-               f'({self.bAoAAzimuth.hex()}), ' + \
-               f'AoAAzimuthFOM : {self.AoAAzimuthFOM} ' + \
-               f'AoAElevation : {self.AoAElevation} ' + \
-               f'({self.bAoAElevation.hex()}), ' + \
-               f'AoAElevationFOM : {self.AoAElevationFOM} ' + \
-               f'AoADestinationAzimuth : {self.AoADestinationAzimuth} ' + \
-               f'({self.bAoADestinationAzimuth.hex()}), ' + \
-               f'AoADestinationAzimuthFOM : ' \
-               f'{self.AoADestinationAzimuthFOM} ' + \
-               f'AoADestinationElevation : {self.AoADestinationElevation} ' + \
-               f'({self.bAoADestinationElevation.hex()})' + \
-               f'AoADestinationElevationFOM : ' \
-               f'{self.AoADestinationElevationFOM}>' + \
-                f'RSSI : -{self.RSSI} '
+        return (f'<{type(self).__name__}: '
+                f'SequenceNumber : {self.SequenceNumber} '
+                f'SessionID : {self.SessionID} '
+                f'MACAddress : {self.MACAddress} '
+                f'Status : {self.Status.name} '
+                f'Distance : {self.Distance} '
+                f'AoAAzimuth : {self.AoAAzimuth} '
+                f'({self.bAoAAzimuth.hex()}), '
+                f'AoAAzimuthFOM : {self.AoAAzimuthFOM} '
+                f'AoAElevation : {self.AoAElevation} '
+                f'({self.bAoAElevation.hex()}), '
+                f'AoAElevationFOM : {self.AoAElevationFOM} '
+                f'AoADestinationAzimuth : {self.AoADestinationAzimuth} '
+                f'({self.bAoADestinationAzimuth.hex()}), '
+                f'AoADestinationAzimuthFOM : '
+                f'{self.AoADestinationAzimuthFOM} '
+                f'AoADestinationElevation : {self.AoADestinationElevation} '
+                f'({self.bAoADestinationElevation.hex()})'
+                f'AoADestinationElevationFOM : '
+                f'{self.AoADestinationElevationFOM}>'
+                f'RSSI : -{self.RSSI} ')
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -569,9 +545,7 @@ def show_device_state(payload):
 
 
 def show_session_state(payload):
-    (sid, status, reason) = ((int).from_bytes(payload[0:4], 'little'),
-                             (int).from_bytes(payload[4:5], 'little'),
-                             (int).from_bytes(payload[5:6], 'little'))
+    (sid, status, reason) = _U32U8U8.unpack_from(payload)
 
     print(Fore.GREEN + 'Session', sid, '→', State(
         status), '(', Reason(reason), ')', end='')
@@ -579,30 +553,24 @@ def show_session_state(payload):
 
 
 def show_ranging(payload):
-    (index, sid) = ((int).from_bytes(payload[0:4], 'little'),
-                    (int).from_bytes(payload[4:8], 'little'))
-
-    print(Fore.BLUE + 'Ranging index', index, 'session', sid, '→', end=' ')
+    (index, sid) = _U32U32.unpack_from(payload)
 
-    n = (int).from_bytes(payload[24:25], 'little')
+    measurements = []
+    n = payload[24]
     for i in range(n):
         p = 25 + i * 31
-        (saddr, status, dist, aoa_azimuth, aoa_azimuth_fom) = (
-            (int).from_bytes(payload[p: p + 2], "little"),
-            (int).from_bytes(payload[p + 2: p + 3], "little"),
-            (int).from_bytes(payload[p + 4: p + 6], "little"),
-            (int).from_bytes(payload[p + 6: p + 8], "little"),
-            (int).from_bytes(payload[p + 8: p + 9], "little"),
-        )
-        print(
-            "saddr", hex(saddr),
-            "status", Status(status),
-            "distance", dist,
-            "aoa_azimuth", aoa_azimuth,
-            "aoa_azimuth_fom", aoa_azimuth_fom,
-            end=" | ",
+        (saddr, status, dist, aoa_azimuth, aoa_azimuth_fom) = \
+            _RANGING_SUMMARY.unpack_from(payload, p)
+        measurements.append(
+            f"saddr {hex(saddr)} "
+            f"status {Status(status)!s} "
+            f"distance {dist} "
+            f"aoa_azimuth {aoa_azimuth} "
+            f"aoa_azimuth_fom {aoa_azimuth_fom} | "
         )
-    print(Style.RESET_ALL)
+
+    print(Fore.BLUE + 'Ranging index', index, 'session', sid, '→',
+          ''.join(measurements) + Style.RESET_ALL)
 
 
 def show_range_data_ntf(payload):
@@ -617,53 +585,59 @@ def show_range_data_ntf(payload):
 
 
 def show_test(payload):
-    status = (int).from_bytes(payload[0:1], 'little')
+    status = payload[0]
 
     print(Fore.MAGENTA + 'test notif', Status(status),
           [hex(x) for x in payload[1:]], end='')
     print(Style.RESET_ALL)
 
 
+notification_default_handlers = types.MappingProxyType({
+    (Gid.UciCore, 0x1): show_device_state,
+    (Gid.UwbSessionConfig, 0x2): show_session_state,
+    (Gid.UwbRangingSessionControl, 0x0): show_range_data_ntf,
+})
+
+
 class Client(core.Client):
     def __init__(self, *args, **kwargs):
-        handlers = {
-            (Gid.UciCore, 0x1): show_device_state,
-            (Gid.UwbSessionConfig, 0x2): show_session_state,
-            (Gid.UwbRangingSessionControl, 0x0): show_range_data_ntf,
-        }
+        handlers = dict(notification_default_handlers)
         handlers.update(kwargs.get('notif_handlers', {}))
         kwargs["notif_handlers"] = handlers
         super().__init__(*args, **kwargs)
 
     def reset_calibration(self):
         payload = self.command(Gid.UwbConfigManager, 0, b'')
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def reset(self, reason):
         payload = (reason).to_bytes(1, 'little')
 
         payload = self.command(Gid.UciCore, 0, payload)
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def info(self):
         payload = self.command(Gid.UciCore, 2, b'')
 
+        (status, generic_version, mac_version, phy_version, test_version,
+         vendor_length) = _CORE_DEVICE_INFO.unpack_from(payload)
+
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
-            (int).from_bytes(payload[1:3], 'little'),
-            (int).from_bytes(payload[3:5], 'little'),
-            (int).from_bytes(payload[5:7], 'little'),
-            (int).from_bytes(payload[7:9], 'little'),
-            (int).from_bytes(payload[9:10], 'little'),
-            struct.unpack(str(payload[9]) + 'B', payload[10:]),
+            Status(status),
+            generic_version,
+            mac_version,
+            phy_version,
+            test_version,
+            vendor_length,
+            struct.unpack(f'{vendor_length}B', payload[10:]),
         )
 
     def get_caps(self):
         payload = self.command(Gid.UciCore, 3, b'')
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
-            (int).from_bytes(payload[1:2], 'little'),
+            Status(payload[0]),
+            payload[1] if len(payload) > 1 else 0,
         )
 
     def set_config(self, tvs):
@@ -672,7 +646,7 @@ class Client(core.Client):
         payload = self.command(Gid.UciCore, 4, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
+            Status(payload[0]),
             core.list_from_bytes(Status, payload[1:])
         )
 
@@ -682,7 +656,7 @@ class Client(core.Client):
         payload = self.command(Gid.UciCore, 5, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
+            Status(payload[0]),
             core.tlvs_from_bytes(Device, payload[1:])
         )
 
@@ -691,13 +665,13 @@ class Client(core.Client):
         payload += (stype).to_bytes(1, 'little')
 
         payload = self.command(Gid.UwbSessionConfig, 0, payload)
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def session_deinit(self, sid):
         payload = (sid).to_bytes(4, 'little')
 
         payload = self.command(Gid.UwbSessionConfig, 1, payload)
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def session_set_app_config(self, sid, params):
         payload = (sid).to_bytes(4, 'little')
@@ -705,15 +679,16 @@ class Client(core.Client):
         payload += core.tvs_to_bytes(App.defs, params)
 
         payload = self.command(Gid.UwbSessionConfig, 3, payload)
+        status = Status(payload[0])
 
-        if Status((int).from_bytes(payload[0:1], 'little')) != 2:
+        if status != Status.Failed:
             return (
-                Status((int).from_bytes(payload[0:1], 'little')),
+                status,
                 core.list_from_bytes(Status, payload[1:]),
             )
         else:
-            return(
-                Status((int).from_bytes(payload[0:1], 'little')),
+            return (
+                status,
                 [],
             )
 
@@ -724,7 +699,7 @@ class Client(core.Client):
         payload = self.command(Gid.UwbSessionConfig, 4, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
+            Status(payload[0]),
             core.tlvs_from_bytes(App, payload[1:])
         )
 
@@ -732,8 +707,8 @@ class Client(core.Client):
         payload = self.command(Gid.UwbSessionConfig, 5, b'')
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
-            (int).from_bytes(payload[1:2], 'little')
+            Status(payload[0]),
+            payload[1] if len(payload) > 1 else 0
         )
 
     def session_get_state(self, sid):
@@ -742,8 +717,8 @@ class Client(core.Client):
         payload = self.command(Gid.UwbSessionConfig, 6, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
-            State((int).from_bytes(payload[1:2], 'little'))
+            Status(payload[0]),
+            State(payload[1] if len(payload) > 1 else State.Init)
         )
 
     def session_start(self, sid):
@@ -761,14 +736,14 @@ class Client(core.Client):
         payload = (sid).to_bytes(4, 'little')
 
         payload = self.command(Gid.UwbRangingSessionControl, 0, payload)
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     # Deprecated for future ussage. Replaced by session_stop_cmd()
     def session_stop_basic(self, sid):
         payload = (sid).to_bytes(4, 'little')
 
         payload = self.command(Gid.UwbRangingSessionControl, 1, payload)
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     # Deprecated for future ussage, test commands available in test_v1_1 client
     def test_config_set(self, sid, params):
@@ -779,7 +754,7 @@ class Client(core.Client):
         payload = self.command(Gid.Test, 0, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
+            Status(payload[0]),
             core.list_from_bytes(Status, payload[1:]),
         )
 
@@ -791,36 +766,36 @@ class Client(core.Client):
         payload = self.command(Gid.Test, 1, payload)
 
         return (
-            Status((int).from_bytes(payload[0:1], 'little')),
+            Status(payload[0]),
             core.tlvs_from_bytes(TestParam, payload[1:]),
         )
 
     def test_periodic_tx(self, payload):
         payload = self.command(Gid.Test, 2, payload)
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def test_per_rx(self, payload):
         payload = self.command(Gid.Test, 3, payload)
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def test_rx(self):
         payload = self.command(Gid.Test, 5, b'')
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def test_loopback(self, payload):
         payload = self.command(Gid.Test, 6, payload)
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def test_stop_session(self):
         payload = self.command(Gid.Test, 7, b'')
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
 
     def test_ss_twr(self):
         payload = self.command(Gid.Test, 8, b'')
 
-        return Status((int).from_bytes(payload[0:1], 'little'))
+        return Status(payload[0])
@@ -33,8 +33,10 @@ if args.verbose:
     logging.basicConfig(level=logging.DEBUG)
 
 # Parse the address and target, bytes are reversed
-dev_mac = int(args.address[-2:] + args.address[0:2], 16)
-dst_mac = int(args.target[-2:] + args.target[0:2], 16)
+dev_mac = int.from_bytes(bytes.fromhex(args.address.replace(':', '')),
+                         'little')
+dst_mac = int.from_bytes(bytes.fromhex(args.target.replace(':', '')),
+                         'little')
 
 client = Client(port=args.port)
 